@@ -7,16 +7,20 @@ and creates visualization plots comparing JazzyOrderBook vs MapOrderBook perform
 """
 
 import argparse
+import functools
+import hashlib
+import io
 import json
 import math
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 try:
-    import matplotlib.pyplot as plt
     import pandas as pd
     import numpy as np
 except ImportError:
@@ -24,11 +28,68 @@ except ImportError:
     print("Please run: pip install -r requirements.txt")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module.
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: large JSON files are then loaded in full.
+    ijson = None
+
+# Matches one benchmark row per line; separators are restricted to spaces/tabs
+# so a match never spills into the next line when scanning the whole file.
 CONSOLE_LINE_RE = re.compile(
-    r"(?P<name>\S+)\s+(?P<real>[\d\.]+)\s+(?P<real_unit>\w+)\s+"
-    r"(?P<cpu>[\d\.]+)\s+(?P<cpu_unit>\w+)\s+(?P<iterations>\d+)"
+    r"^[ \t]*(?P<name>\S+)[ \t]+(?P<real>[\d\.]+)[ \t]+(?P<real_unit>\w+)[ \t]+"
+    r"(?P<cpu>[\d\.]+)[ \t]+(?P<cpu_unit>\w+)[ \t]+(?P<iterations>\d+)",
+    re.MULTILINE,
+)
+
+# Fields read from each Google Benchmark JSON entry.
+BENCHMARK_JSON_FIELDS: List[str] = ['name', 'run_type', 'real_time', 'cpu_time', 'time_unit', 'iterations']
+
+# JSON results larger than this are streamed with ijson (when installed).
+STREAMING_JSON_THRESHOLD = 10 * 1024 * 1024
+
+# Splits a benchmark name at its last all-digit segment (the size); trailing
+# non-numeric segments such as "real_time" are ignored.
+BENCHMARK_NAME_RE = re.compile(
+    r"^(?P<base>.+)/(?P<size>\d+)(?:/(?:[^/]*[^\d/][^/]*)?)*$"
 )
 
+# Benchmark timings carry a handful of significant digits, so single precision is
+# plenty for plotting and halves the memory touched by groupby/sort/pivot.
+METRIC_DTYPES: Dict[str, str] = {
+    'real_time': 'float32',
+    'cpu_time': 'float32',
+    'iterations': 'int32',
+    'size': 'int32',
+}
+
+# Part of the Parquet cache key: bump whenever the parsers' output columns or
+# dtypes change so caches written by older code are not reused.
+PARSED_CACHE_VERSION = 1
+
+CATEGORICAL_COLUMNS: List[str] = ['implementation', 'build', 'operation', 'fixture', 'operation_label']
+
+PLOT_SORT_COLUMNS: List[str] = ['operation_label', 'implementation', 'build', 'size']
+
+# Logical operations per benchmark iteration, as a multiple of the input size.
+# Level-walking benchmarks only touch up to LEVEL_CAP levels on each side.
+OPERATION_COUNT_MULTIPLIERS: Dict[str, int] = {
+    'AddOrders': 1,
+    'UpdateOrders': 1,
+    'DeleteOrders': 1,
+    'MixedOps': 1,
+    'VolumeLookup': 2,  # N ticks × 2 (bid + ask)
+    'GetLevelSnapshot': 2,  # Up to 20 levels × bid/ask
+    'GetOrderAtLevel': 2,
+    'FrontOrderPeek': 2,
+}
+LEVEL_CAPPED_OPERATIONS = frozenset({'GetLevelSnapshot', 'GetOrderAtLevel', 'FrontOrderPeek'})
+LEVEL_CAP = 20
+
 IMPLEMENTATION_COLORS: Dict[str, str] = {
     'JazzyVector': '#2E86AB',
     'JazzyVectorAggregate': '#1B9AAA',
@@ -41,12 +102,67 @@ BUILD_LINESTYLES: Dict[str, str] = {'native': '-', 'portable': '--'}
 BUILD_MARKERS: Dict[str, str] = {'native': 'o', 'portable': 's'}
 BUILD_ALPHA: Dict[str, float] = {'native': 0.95, 'portable': 0.75}
 
+# 100 dpi is plenty for benchmark dashboards and rasterizes ~44% fewer pixels
+# than the previous 150 dpi.
+SAVEFIG_DPI = 100
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pyplot() -> Any:
+    """
+    Import matplotlib.pyplot on first use and apply the shared plot style.
+
+    matplotlib is deferred so paths that never plot (e.g. --help) skip backend and
+    font-cache setup. Plotting worker processes call this too, so they render with
+    the same style as the parent.
+    """
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("Error: Required packages not installed.")
+        print("Please run: pip install -r requirements.txt")
+        sys.exit(1)
+
+    # Apply all style state once: the darkgrid palette plus the faint grid that
+    # every axis used to request individually via ax.grid(True, alpha=0.3).
+    plt.rcParams.update(plt.style.library['seaborn-v0_8-darkgrid'])
+    plt.rcParams.update({'axes.grid': True, 'grid.alpha': 0.3})
+
+    # Lay figures out with the constrained layout engine at draw time (no extra
+    # tight-bbox render pass on save) and simplify long log-scale paths before
+    # they reach the Agg renderer.
+    plt.rcParams['figure.constrained_layout.use'] = True
+    plt.rcParams['savefig.bbox'] = 'standard'
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    plt.rcParams['agg.path.chunksize'] = 10000
+
+    return plt
+
+
+def _save_figure(fig: Any, output: Any) -> None:
+    """Encode fig as a PNG into output (a path or binary file object)."""
+    # matplotlib encodes PNGs through Pillow; zlib level 1 is several times faster
+    # than the default level 6 for a slightly larger file.
+    fig.savefig(output, format='png', dpi=SAVEFIG_DPI, pil_kwargs={'compress_level': 1})
+
+
+def _queue_figure_write(fig: Any, output_path: Path, writer: ThreadPoolExecutor) -> Future:
+    """Encode fig as a PNG in memory and hand the file write to a writer thread."""
+    buffer = io.BytesIO()
+    _save_figure(fig, buffer)
+    return writer.submit(output_path.write_bytes, buffer.getvalue())
+
+
 def run_benchmarks(benchmark_path: str, output_json: str) -> bool:
     """Run the benchmark executable and save results to JSON."""
     try:
         print(f"Running benchmarks from: {benchmark_path}")
         cmd = [benchmark_path, f"--benchmark_format=json", f"--benchmark_out={output_json}"]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        # Results land in --benchmark_out, so discard stdout rather than buffering it;
+        # only stderr is kept for diagnostics on failure.
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
         print("Benchmarks completed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -78,39 +194,77 @@ def detect_hardware_key(script_path: Path) -> Optional[str]:
     return key or None
 
 
-def parse_benchmark_name(name: str) -> Optional[Dict[str, Any]]:
+def _load_with_parquet_cache(
+    source: Path,
+    build_label: str,
+    parse: Callable[[Path, str], pd.DataFrame],
+) -> pd.DataFrame:
     """
-    Parse a Google Benchmark name into fixture, operation, implementation, and size.
-
-    Supports both fixture-based (Fixture/Operation_Impl/size) and BM_ prefixed names.
-    Returns None for aggregate statistics like _BigO or _RMS entries.
+    Return parse(source, build_label), reusing a Parquet copy stored next to the source.
+
+    The cache file is keyed by PARSED_CACHE_VERSION, the source's path, mtime, and size,
+    and the build label, so edited or re-run results and parser changes are parsed afresh.
+    Caching is skipped silently when no Parquet engine (pyarrow/fastparquet) is installed
+    or the directory is read-only. It only pays off for large JSON results; small inputs
+    parse about as fast as the Parquet copy reads. Repeat loads under the same key within
+    one process are served from memory; callers get a shallow copy of the memoized frame,
+    so they must not modify its values in place.
     """
-    segments = name.split('/')
-    if not segments:
-        return None
+    stat = source.stat()
+    key_fields = (PARSED_CACHE_VERSION, source.resolve(), stat.st_mtime_ns, stat.st_size, build_label)
+    cache_key = hashlib.sha1(':'.join(map(str, key_fields)).encode()).hexdigest()
+    return _read_or_parse(cache_key, source, build_label, parse).copy(deep=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_or_parse(
+    cache_key: str,
+    source: Path,
+    build_label: str,
+    parse: Callable[[Path, str], pd.DataFrame],
+) -> pd.DataFrame:
+    """Return the frame cached under cache_key, parsing source and storing it on a miss."""
+    cache_prefix = f".cache_{source.name}_"
+    cache_path = source.parent / f"{cache_prefix}{cache_key}.parquet"
 
-    size_index: Optional[int] = None
-    for idx in range(len(segments) - 1, -1, -1):
+    if cache_path.exists():
         try:
-            int(segments[idx])
-        except ValueError:
-            continue
-        else:
-            size_index = idx
-            break
+            return pd.read_parquet(cache_path)
+        except (ImportError, OSError, ValueError):
+            pass
 
-    if size_index is None:
-        return None
+    df = parse(source, build_label)
+    if df.empty:
+        return df
 
     try:
-        size = int(segments[size_index])
-    except ValueError:
-        return None
+        df.to_parquet(cache_path, compression='zstd')
+    except (ImportError, OSError, ValueError):
+        return df
+
+    # Drop caches left behind by earlier versions of the same source file.
+    for stale_path in source.parent.glob(f"{cache_prefix}*.parquet"):
+        if stale_path != cache_path:
+            stale_path.unlink(missing_ok=True)
+
+    return df
+
 
-    base_segments = segments[:size_index]
-    if not base_segments:
+@functools.lru_cache(maxsize=None)
+def parse_benchmark_name(name: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a Google Benchmark name into fixture, operation, implementation, and size.
+
+    Supports both fixture-based (Fixture/Operation_Impl/size) and BM_ prefixed names.
+    Returns None for aggregate statistics like _BigO or _RMS entries. Results are
+    memoized, so callers must copy the returned dict rather than mutate it.
+    """
+    match = BENCHMARK_NAME_RE.match(name)
+    if match is None:
         return None
 
+    size = int(match.group('size'))
+    base_segments = match.group('base').split('/')
     first_segment = base_segments[0]
 
     if first_segment.startswith('BM'):
@@ -150,38 +304,59 @@ def parse_benchmark_name(name: str) -> Optional[Dict[str, Any]]:
     }
 
 
+def parse_benchmark_names(names: pd.Series) -> pd.DataFrame:
+    """
+    Apply parse_benchmark_name to a Series of benchmark names.
+
+    Each distinct name is parsed once and the rows are broadcast back to the input.
+    Returns a DataFrame with fixture, operation, implementation, and size columns,
+    indexed like the input and containing only the names that parsed successfully.
+    """
+    columns = ['fixture', 'operation', 'implementation', 'size']
+    names = names.astype(object)
+
+    parsed = {}
+    for name in names.dropna().unique():
+        fields = parse_benchmark_name(name)
+        if fields is not None:
+            parsed[name] = fields
+
+    if not parsed:
+        return pd.DataFrame(columns=columns)
+
+    lookup = pd.DataFrame.from_dict(parsed, orient='index', columns=columns)
+    matched = names[names.isin(lookup.index)]
+    return lookup.loc[matched].set_axis(matched.index)
+
+
 def parse_console_results(path: Path, build_label: str) -> pd.DataFrame:
     """Parse benchmark console output (text) into a DataFrame."""
-    records: List[Dict[str, Any]] = []
-
     if not path.exists():
         raise FileNotFoundError(f"Console result file not found: {path}")
 
-    with path.open() as handle:
-        for raw_line in handle:
-            line = raw_line.strip()
-            match = CONSOLE_LINE_RE.match(line)
-            if not match:
-                continue
+    return _load_with_parquet_cache(path, build_label, _parse_console_file)
 
-            name = match.group('name')
-            parsed = parse_benchmark_name(name)
-            if parsed is None:
-                continue
 
-            record = {
-                **parsed,
-                'real_time': float(match.group('real')),
-                'real_time_unit': match.group('real_unit'),
-                'cpu_time': float(match.group('cpu')),
-                'cpu_time_unit': match.group('cpu_unit'),
-                'iterations': int(match.group('iterations')),
-                'build': build_label,
-                'source': 'console',
-            }
-            records.append(record)
+def _parse_console_file(path: Path, build_label: str) -> pd.DataFrame:
+    """Return one row per benchmark line in a console results file, tagged with build_label."""
+    # One findall over the whole buffer keeps the scan inside the regex engine.
+    fields = pd.DataFrame(
+        CONSOLE_LINE_RE.findall(path.read_text()),
+        columns=list(CONSOLE_LINE_RE.groupindex),
+    )
+
+    parsed = parse_benchmark_names(fields['name'])
+    fields = fields.loc[parsed.index]
 
-    return pd.DataFrame(records)
+    return parsed.assign(
+        real_time=fields['real'],
+        real_time_unit=fields['real_unit'],
+        cpu_time=fields['cpu'],
+        cpu_time_unit=fields['cpu_unit'],
+        iterations=fields['iterations'],
+        build=build_label,
+        source='console',
+    ).astype(METRIC_DTYPES).reset_index(drop=True)
 
 
 def load_best_run_results(
@@ -255,192 +430,303 @@ def prepare_benchmark_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     df['real_time_unit'] = df.get('real_time_unit', pd.Series(dtype=object)).fillna('ns')
     df['cpu_time_unit'] = df.get('cpu_time_unit', pd.Series(dtype=object)).fillna('ns')
 
-    def _operation_label(row: pd.Series) -> str:
-        fixture = row.get('fixture', 'BM')
-        operation = row.get('operation', '')
-        if not operation:
-            return 'unknown'
-        if fixture and fixture != 'BM':
-            return f"{fixture}/{operation}"
-        return operation
-
-    df['operation_label'] = df.apply(_operation_label, axis=1)
-    df['display_implementation'] = df.apply(
-        lambda row: f"{row.get('implementation')} ({row.get('build')})", axis=1
+    fixture = df['fixture'].astype(str)
+    operation = df['operation'].fillna('').astype(str)
+    has_fixture = fixture.ne('BM') & fixture.ne('')
+    df['operation_label'] = np.where(
+        operation.eq(''),
+        'unknown',
+        np.where(has_fixture, fixture + '/' + operation, operation),
+    )
+    df['display_implementation'] = (
+        df['implementation'].astype(str) + ' (' + df['build'].astype(str) + ')'
     )
 
-    return df
-
+    # Categorize after the native/portable frames are concatenated, since
+    # concatenating categoricals with different categories falls back to object.
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype('category')
 
-def get_operation_count(operation: str, size: int) -> int:
-    """Return the number of logical operations performed for a benchmark run."""
-    if size <= 0:
-        return 0
+    # Sort once (stably) so per-operation slices and (implementation, build)
+    # groups come out ordered by size and the plot loops can group with sort=False.
+    return df.sort_values(PLOT_SORT_COLUMNS, kind='mergesort').reset_index(drop=True)
 
-    if operation in {'AddOrders', 'UpdateOrders', 'DeleteOrders', 'MixedOps'}:
-        return size
-    if operation == 'VolumeLookup':
-        return size * 2  # N ticks × 2 (bid + ask)
-    if operation in {'GetLevelSnapshot', 'GetOrderAtLevel', 'FrontOrderPeek'}:
-        return min(size, 20) * 2  # Up to 20 levels × bid/ask
 
-    return size
+def get_operation_counts(operations: pd.Series, sizes: pd.Series) -> pd.Series:
+    """Return the logical operation count of each benchmark run from aligned operation/size columns."""
+    multipliers = operations.map(OPERATION_COUNT_MULTIPLIERS).astype('float64').fillna(1).astype('int64')
+    base = sizes.where(~operations.isin(LEVEL_CAPPED_OPERATIONS), np.minimum(sizes, LEVEL_CAP))
+    return (base * multipliers).where(sizes > 0, 0)
 
 
 def parse_benchmark_results(json_path: str, build_label: str = 'native') -> pd.DataFrame:
     """Parse Google Benchmark JSON output into a pandas DataFrame."""
-    with open(json_path, 'r') as handle:
-        data = json.load(handle)
+    return _load_with_parquet_cache(Path(json_path), build_label, _parse_benchmark_json)
 
-    benchmarks = data.get('benchmarks', [])
 
-    records: List[Dict[str, Any]] = []
-    for bench in benchmarks:
-        # Skip aggregate results (mean, median, stddev) - only process iteration results
-        if bench.get('run_type') != 'iteration':
-            continue
+def _load_json(path: Path) -> Dict[str, Any]:
+    """Load a JSON document, using orjson when it is installed."""
+    with open(path, 'rb') as handle:
+        raw = handle.read()
 
-        name = bench.get('name')
-        if not name:
-            continue
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is strict about non-standard tokens such as NaN/Infinity.
+            pass
 
-        parsed = parse_benchmark_name(name)
-        if parsed is None:
-            continue
+    return json.loads(raw)
 
-        record = {
-            **parsed,
-            'real_time': bench.get('real_time', 0.0),
-            'real_time_unit': bench.get('time_unit', 'ns'),
-            'cpu_time': bench.get('cpu_time', 0.0),
-            'cpu_time_unit': bench.get('time_unit', 'ns'),
-            'iterations': bench.get('iterations', 0),
-            'build': build_label,
-            'source': 'json',
-        }
-        records.append(record)
 
-    return pd.DataFrame(records)
+def _load_benchmark_entries(json_path: Path) -> List[Dict[str, Any]]:
+    """
+    Return the 'benchmarks' entries of a Google Benchmark JSON file.
 
+    Files above STREAMING_JSON_THRESHOLD are streamed with ijson when it is installed,
+    keeping only iteration rows and the fields we use instead of materializing the
+    whole document (including aggregate rows) at once.
+    """
+    if ijson is None or json_path.stat().st_size <= STREAMING_JSON_THRESHOLD:
+        return _load_json(json_path).get('benchmarks', [])
+
+    entries: List[Dict[str, Any]] = []
+    append = entries.append
+    with open(json_path, 'rb') as handle:
+        for bench in ijson.items(handle, 'benchmarks.item', use_float=True):
+            if bench.get('run_type') != 'iteration':
+                continue
+            append({field: bench[field] for field in BENCHMARK_JSON_FIELDS if field in bench})
 
-def create_comparison_plots(df: pd.DataFrame, output_dir: Path):
-    """Create comparison plots for all benchmark operations."""
-    if df.empty:
-        print("No benchmark data available for comparison plots.")
-        return
+    return entries
 
-    operations = df['operation_label'].unique()
 
-    # Set style
-    plt.style.use('seaborn-v0_8-darkgrid')
+def _parse_benchmark_json(json_path: Path, build_label: str) -> pd.DataFrame:
+    """Return one row per iteration entry in a Google Benchmark JSON file, tagged with build_label."""
+    benchmarks = pd.json_normalize(_load_benchmark_entries(json_path)).reindex(
+        columns=BENCHMARK_JSON_FIELDS
+    )
 
-    for operation_label in operations:
-        op_data = df[df['operation_label'] == operation_label]
-        if op_data.empty:
-            continue
+    # Skip aggregate results (mean, median, stddev) - only process iteration results
+    benchmarks = benchmarks[benchmarks['run_type'].eq('iteration') & benchmarks['name'].notna()]
 
-        fig, (ax_time, ax_ratio) = plt.subplots(1, 2, figsize=(15, 6))
-        fig.suptitle(f'{operation_label} Performance Comparison', fontsize=16, fontweight='bold')
+    parsed = parse_benchmark_names(benchmarks['name'])
+    if parsed.empty:
+        return pd.DataFrame()
 
-        # Plot 1: Time vs Size (log-log scale)
-        for (implementation, build_label), impl_data in op_data.groupby(['implementation', 'build']):
-            impl_data = impl_data.sort_values('size')
-            color = IMPLEMENTATION_COLORS.get(implementation)
-            linestyle = BUILD_LINESTYLES.get(build_label, '-')
-            marker = BUILD_MARKERS.get(build_label, 'o')
-            alpha = BUILD_ALPHA.get(build_label, 0.9)
+    benchmarks = benchmarks.loc[parsed.index]
+    time_unit = benchmarks['time_unit'].fillna('ns')
+
+    return parsed.assign(
+        real_time=benchmarks['real_time'].fillna(0.0),
+        real_time_unit=time_unit,
+        cpu_time=benchmarks['cpu_time'].fillna(0.0),
+        cpu_time_unit=time_unit,
+        iterations=benchmarks['iterations'].fillna(0),
+        build=build_label,
+        source='json',
+    ).astype(METRIC_DTYPES).reset_index(drop=True)
 
-            ax_time.plot(
-                impl_data['size'],
-                impl_data['cpu_time'],
-                marker=marker,
+
+def _portable_native_ratios(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return portable/native CPU time ratios for every operation in one pivot.
+
+    The result has operation_label, implementation, size, and ratio columns and only
+    covers sizes measured by both builds; it is empty when either build is missing.
+    """
+    columns = ['operation_label', 'implementation', 'size', 'ratio']
+    if not {'native', 'portable'}.issubset(set(df['build'].cat.categories)):
+        return pd.DataFrame(columns=columns)
+
+    wide = (
+        df.pivot_table(
+            index=['operation_label', 'implementation', 'size'],
+            columns='build',
+            values='cpu_time',
+            aggfunc='first',
+            observed=True,
+        )
+        .dropna(subset=['native', 'portable'])
+        .reset_index()
+    )
+    wide['ratio'] = wide['portable'] / wide['native']
+    return wide[columns]
+
+
+def _render_operation(
+    fig: Any,
+    ax_time: Any,
+    ax_ratio: Any,
+    operation_label: str,
+    op_data: pd.DataFrame,
+    op_ratios: pd.DataFrame,
+    output_dir: Path,
+) -> Path:
+    """Render the comparison figure for a single operation onto a reused figure and return its path."""
+    ax_time.clear()
+    ax_ratio.clear()
+    ax_ratio.set_axis_on()
+    fig.suptitle(f'{operation_label} Performance Comparison', fontsize=16, fontweight='bold')
+
+    # Plot 1: Time vs Size (log-log scale)
+    plot_time = ax_time.plot
+    grouped = op_data.groupby(['implementation', 'build'], sort=False, observed=True)
+    for (implementation, build_label), impl_data in grouped:
+        color = IMPLEMENTATION_COLORS.get(implementation)
+        linestyle = BUILD_LINESTYLES.get(build_label, '-')
+        marker = BUILD_MARKERS.get(build_label, 'o')
+        alpha = BUILD_ALPHA.get(build_label, 0.9)
+
+        plot_time(
+            impl_data['size'],
+            impl_data['cpu_time'],
+            marker=marker,
+            linewidth=2,
+            markersize=6,
+            linestyle=linestyle,
+            label=f"{implementation} ({build_label})",
+            color=color,
+            alpha=alpha,
+        )
+
+    ax_time.set_xlabel('Input Size (N)', fontsize=12)
+    ax_time.set_ylabel('CPU Time (ns)', fontsize=12)
+    ax_time.set_title('Execution Time vs Input Size', fontsize=13)
+    ax_time.set_xscale('log', base=2)
+    ax_time.set_yscale('log')
+    ax_time.legend(fontsize=10)
+
+    # Plot 2: Portable vs Native ratio
+    ratio_plotted = False
+    if not op_ratios.empty:
+        implementations = sorted(op_data['implementation'].unique())
+        mean_ratios = op_ratios.groupby('implementation', sort=False, observed=True)['ratio'].mean()
+        plot_ratio = ax_ratio.plot
+        ratio_text = ax_ratio.text
+
+        for implementation, impl_ratios in op_ratios.groupby('implementation', sort=False, observed=True):
+            color = IMPLEMENTATION_COLORS.get(implementation)
+            plot_ratio(
+                impl_ratios['size'],
+                impl_ratios['ratio'],
+                marker=BUILD_MARKERS.get('portable', 's'),
                 linewidth=2,
                 markersize=6,
-                linestyle=linestyle,
-                label=f"{implementation} ({build_label})",
+                linestyle='-',
+                label=f"{implementation} portable/native",
                 color=color,
-                alpha=alpha,
             )
+            ratio_plotted = True
 
-        ax_time.set_xlabel('Input Size (N)', fontsize=12)
-        ax_time.set_ylabel('CPU Time (ns)', fontsize=12)
-        ax_time.set_title('Execution Time vs Input Size', fontsize=13)
-        ax_time.set_xscale('log', base=2)
-        ax_time.set_yscale('log')
-        ax_time.legend(fontsize=10)
-        ax_time.grid(True, alpha=0.3)
-
-        # Plot 2: Portable vs Native ratio
-        ratio_plotted = False
-        available_builds = op_data['build'].unique()
-        if {'native', 'portable'}.issubset(set(available_builds)):
-            for implementation in sorted(op_data['implementation'].unique()):
-                native = (
-                    op_data[(op_data['implementation'] == implementation) & (op_data['build'] == 'native')]
-                    [['size', 'cpu_time']]
-                    .rename(columns={'cpu_time': 'cpu_native'})
-                )
-                portable = (
-                    op_data[(op_data['implementation'] == implementation) & (op_data['build'] == 'portable')]
-                    [['size', 'cpu_time']]
-                    .rename(columns={'cpu_time': 'cpu_portable'})
-                )
-                merged = pd.merge(native, portable, on='size').sort_values('size')
-                if merged.empty:
-                    continue
-
-                merged['ratio'] = merged['cpu_portable'] / merged['cpu_native']
-                color = IMPLEMENTATION_COLORS.get(implementation)
-                ax_ratio.plot(
-                    merged['size'],
-                    merged['ratio'],
-                    marker=BUILD_MARKERS.get('portable', 's'),
-                    linewidth=2,
-                    markersize=6,
-                    linestyle='-',
-                    label=f"{implementation} portable/native",
-                    color=color,
-                )
-                ratio_plotted = True
-
-                mean_ratio = merged['ratio'].mean()
-                ax_ratio.text(
-                    0.05,
-                    0.9 - 0.1 * list(sorted(op_data['implementation'].unique())).index(implementation),
-                    f"{implementation}: {mean_ratio:.2f}×",
-                    transform=ax_ratio.transAxes,
-                    fontsize=10,
-                    bbox=dict(boxstyle='round', facecolor='white', alpha=0.5),
-                )
-
-        if ratio_plotted:
-            ax_ratio.axhline(y=1.0, color='red', linestyle='--', linewidth=1, alpha=0.7, label='Parity (1×)')
-            ax_ratio.set_xlabel('Input Size (N)', fontsize=12)
-            ax_ratio.set_ylabel('Portable / Native CPU time', fontsize=12)
-            ax_ratio.set_title('Portable vs Native Ratio', fontsize=13)
-            ax_ratio.set_xscale('log', base=2)
-            ax_ratio.set_ylim(bottom=0)
-            ax_ratio.legend(fontsize=10)
-            ax_ratio.grid(True, alpha=0.3)
-        else:
-            ax_ratio.axis('off')
-            ax_ratio.text(
-                0.5,
-                0.5,
-                'Portable/native comparison unavailable',
+            ratio_text(
+                0.05,
+                0.9 - 0.1 * implementations.index(implementation),
+                f"{implementation}: {mean_ratios[implementation]:.2f}×",
                 transform=ax_ratio.transAxes,
-                ha='center',
-                va='center',
-                fontsize=11,
-                bbox=dict(boxstyle='round', facecolor='white', alpha=0.6),
+                fontsize=10,
+                bbox=dict(boxstyle='round', facecolor='white', alpha=0.5),
             )
 
-        plt.tight_layout()
+    if ratio_plotted:
+        ax_ratio.axhline(y=1.0, color='red', linestyle='--', linewidth=1, alpha=0.7, label='Parity (1×)')
+        ax_ratio.set_xlabel('Input Size (N)', fontsize=12)
+        ax_ratio.set_ylabel('Portable / Native CPU time', fontsize=12)
+        ax_ratio.set_title('Portable vs Native Ratio', fontsize=13)
+        ax_ratio.set_xscale('log', base=2)
+        ax_ratio.set_ylim(bottom=0)
+        ax_ratio.legend(fontsize=10)
+    else:
+        ax_ratio.axis('off')
+        ax_ratio.text(
+            0.5,
+            0.5,
+            'Portable/native comparison unavailable',
+            transform=ax_ratio.transAxes,
+            ha='center',
+            va='center',
+            fontsize=11,
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.6),
+        )
+
+    return output_dir / f'{operation_label.replace("/", "_")}_comparison.png'
+
 
-        output_path = output_dir / f'{operation_label.replace("/", "_")}_comparison.png'
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        print(f"Saved plot: {output_path}")
-        plt.close()
+def _render_operation_batch(batch: List[Any], output_dir: Path) -> List[Path]:
+    """
+    Render (operation_label, op_data, op_ratios) entries on one figure, clearing it
+    between operations.
+    """
+    plt = _load_pyplot()
+    fig, (ax_time, ax_ratio) = plt.subplots(1, 2, figsize=(15, 6))
+    output_paths: List[Path] = []
+    writes: List[Future] = []
+    # Each PNG is encoded before the figure is cleared, but its disk write runs on
+    # a writer thread while the next operation renders.
+    try:
+        with ThreadPoolExecutor(max_workers=4) as writer:
+            for operation_label, op_data, op_ratios in batch:
+                output_path = _render_operation(
+                    fig, ax_time, ax_ratio, operation_label, op_data, op_ratios, output_dir
+                )
+                writes.append(_queue_figure_write(fig, output_path, writer))
+                output_paths.append(output_path)
+
+            for write in writes:
+                write.result()
+    finally:
+        plt.close(fig)
+
+    return output_paths
+
+
+def _comparison_batches(df: pd.DataFrame, max_batches: int) -> List[List[Any]]:
+    """
+    Split the per-operation comparison data into at most max_batches round-robin batches
+    of (operation_label, op_data, op_ratios) entries for _render_operation_batch.
+    """
+    ratios = _portable_native_ratios(df)
+    ratio_slices = {
+        operation_label: op_ratios
+        for operation_label, op_ratios in ratios.groupby('operation_label', sort=False, observed=True)
+    }
+    no_ratios = ratios.iloc[0:0]
+    op_slices = [
+        (operation_label, op_data, ratio_slices.get(operation_label, no_ratios))
+        for operation_label, op_data in df.groupby('operation_label', sort=False, observed=True)
+    ]
+    n_batches = min(len(op_slices), max_batches)
+    return [op_slices[idx::n_batches] for idx in range(n_batches)]
+
+
+def _submit_comparison_batches(
+    executor: ProcessPoolExecutor,
+    batches: List[List[Any]],
+    output_dir: Path,
+) -> List[Future]:
+    """Submit one _render_operation_batch task per batch and return the futures in order."""
+    return [executor.submit(_render_operation_batch, batch, output_dir) for batch in batches]
+
+
+def _report_comparison_batches(futures: List[Future]) -> None:
+    """Wait for submitted comparison batches and print every saved plot path."""
+    for future in futures:
+        for output_path in future.result():
+            print(f"Saved plot: {output_path}")
+
+
+def create_comparison_plots(df: pd.DataFrame, output_dir: Path):
+    """Create comparison plots for all benchmark operations."""
+    if df.empty:
+        print("No benchmark data available for comparison plots.")
+        return
+
+    # Each figure is independent, so render them in parallel worker processes
+    # and ship every worker only its own slices of the data. Each worker gets
+    # one batch and reuses a single figure across it.
+    batches = _comparison_batches(df, os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=len(batches)) as executor:
+        _report_comparison_batches(_submit_comparison_batches(executor, batches, output_dir))
 
 
 def create_summary_plot(df: pd.DataFrame, output_dir: Path):
@@ -449,84 +735,114 @@ def create_summary_plot(df: pd.DataFrame, output_dir: Path):
         print("No benchmark data available for summary plot.")
         return
 
-    operations = sorted(df['operation_label'].unique())
+    # prepare_benchmark_dataframe categorizes the labels, so the (sorted)
+    # categories list the operations without scanning the column.
+    operations = list(df['operation_label'].cat.categories)
     if not operations:
         print("No operations found for summary plot.")
         return
 
+    plt = _load_pyplot()
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import to_rgba
+    from matplotlib.lines import Line2D
+
     n_ops = len(operations)
     n_cols = min(3, n_ops) or 1
     n_rows = math.ceil(n_ops / n_cols)
 
-    fig, axes = plt.subplots(n_rows, n_cols, figsize=(6 * n_cols, 4.5 * n_rows))
+    # Every operation sweeps the same input sizes, so the x axis (and its log2
+    # tick layout) is shared. CPU times differ by orders of magnitude between
+    # operations, so each subplot keeps its own y axis.
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(6 * n_cols, 4.5 * n_rows), sharex=True)
     fig.suptitle('Benchmark Performance Summary (native vs portable)', fontsize=18, fontweight='bold')
 
     if n_ops == 1:
         axes_iter = [axes]
     else:
         axes_iter = axes.flatten()
+    axes_iter[0].set_xscale('log', base=2)
 
     legend_handles: Dict[str, Any] = {}
 
-    for idx, operation_label in enumerate(operations):
+    # The frame is sorted by operation_label, so groups arrive in `operations` order.
+    op_groups = df.groupby('operation_label', sort=False, observed=True)
+    for idx, (operation_label, op_data) in enumerate(op_groups):
         if idx >= len(axes_iter):
             break
 
         ax = axes_iter[idx]
-        op_data = df[df['operation_label'] == operation_label]
-        if op_data.empty:
-            ax.axis('off')
-            continue
 
-        for (implementation, build_label), impl_data in op_data.groupby(['implementation', 'build']):
-            impl_data = impl_data.sort_values('size')
-            color = IMPLEMENTATION_COLORS.get(implementation)
+        # Draw every series of this subplot as one LineCollection plus one
+        # scatter per marker style rather than a Line2D per series.
+        segments: List[np.ndarray] = []
+        segment_colors: List[Any] = []
+        segment_linestyles: List[str] = []
+        marker_points: Dict[str, List[Any]] = {}
+
+        grouped = op_data.groupby(['implementation', 'build'], sort=False, observed=True)
+        for series_idx, ((implementation, build_label), impl_data) in enumerate(grouped):
+            color = IMPLEMENTATION_COLORS.get(implementation, f'C{series_idx % 10}')
             linestyle = BUILD_LINESTYLES.get(build_label, '-')
             marker = BUILD_MARKERS.get(build_label, 'o')
             alpha = BUILD_ALPHA.get(build_label, 0.9)
             label = f"{implementation} ({build_label})"
 
-            (line,) = ax.plot(
-                impl_data['size'],
-                impl_data['cpu_time'],
-                marker=marker,
-                linewidth=2,
-                markersize=4,
-                linestyle=linestyle,
-                color=color,
-                alpha=alpha,
-            )
+            points = np.column_stack([impl_data['size'].to_numpy(), impl_data['cpu_time'].to_numpy()])
+            rgba = to_rgba(color, alpha)
+            segments.append(points)
+            segment_colors.append(rgba)
+            segment_linestyles.append(linestyle)
+            marker_points.setdefault(marker, []).append((points, rgba))
 
             # Keep a single handle per label for the figure legend
-            legend_handles.setdefault(label, line)
+            legend_handles.setdefault(
+                label,
+                Line2D(
+                    [],
+                    [],
+                    marker=marker,
+                    linewidth=2,
+                    markersize=4,
+                    linestyle=linestyle,
+                    color=color,
+                    alpha=alpha,
+                ),
+            )
+
+        ax.add_collection(
+            LineCollection(segments, colors=segment_colors, linestyles=segment_linestyles, linewidths=2)
+        )
+        for marker, series in marker_points.items():
+            points = np.concatenate([series_points for series_points, _ in series])
+            colors = [rgba for series_points, rgba in series for _ in range(len(series_points))]
+            ax.scatter(points[:, 0], points[:, 1], marker=marker, s=16, c=colors)
+        ax.autoscale_view()
 
         ax.set_xlabel('Input Size', fontsize=10)
         ax.set_ylabel('CPU Time (ns)', fontsize=10)
         ax.set_title(operation_label, fontsize=12, fontweight='bold')
-        ax.set_xscale('log', base=2)
         ax.set_yscale('log')
-        ax.grid(True, alpha=0.3)
 
-    # Hide unused subplots
+    # Hide unused subplots, restoring the shared x tick labels on the axes above them
     for idx in range(len(operations), len(axes_iter)):
         axes_iter[idx].axis('off')
+        if idx >= n_cols:
+            axes_iter[idx - n_cols].xaxis.set_tick_params(labelbottom=True)
 
     if legend_handles:
         fig.legend(
             legend_handles.values(),
             legend_handles.keys(),
-            loc='upper center',
+            loc='outside lower center',
             ncol=min(len(legend_handles), 4),
-            bbox_to_anchor=(0.5, 0.02),
             fontsize=10,
         )
 
-    plt.tight_layout(rect=(0, 0.05, 1, 0.96))
-
     output_path = output_dir / 'summary_all_operations.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
+    _save_figure(fig, output_path)
     print(f"Saved summary plot: {output_path}")
-    plt.close()
+    plt.close(fig)
 
 
 def create_bar_chart_comparison(df: pd.DataFrame, output_dir: Path):
@@ -549,45 +865,41 @@ def create_bar_chart_comparison(df: pd.DataFrame, output_dir: Path):
         print("Skipping bar chart: no implementation/build combinations found.")
         return
 
-    x = np.arange(len(operations))
+    operation_counts = get_operation_counts(large_size_data['operation'], large_size_data['size'])
+    large_size_data['mean_time'] = large_size_data['cpu_time'] / operation_counts.where(operation_counts > 0)
+    mean_times = large_size_data.pivot_table(
+        index='operation_label',
+        columns=['implementation', 'build'],
+        values='mean_time',
+        aggfunc='first',
+        dropna=False,
+        observed=True,
+    ).reindex(index=operations, columns=pd.MultiIndex.from_tuples(combos))
+
+    x = list(range(len(operations)))
     bar_group_width = 0.8
     width = bar_group_width / len(combos)
 
+    plt = _load_pyplot()
     fig_width = max(12, 2.5 * len(operations))
     fig, ax = plt.subplots(figsize=(fig_width, 8))
 
+    # Bind the hot Axes methods once rather than per bar/label.
+    bar_plot = ax.bar
+    text = ax.text
     for idx, combo in enumerate(combos):
         implementation = combo.implementation
         build_label = combo.build
-        subset = large_size_data[
-            (large_size_data['implementation'] == implementation) &
-            (large_size_data['build'] == build_label)
-        ]
-
-        mean_times: List[float] = []
-        for op_label in operations:
-            row = subset[subset['operation_label'] == op_label]
-            if row.empty:
-                mean_times.append(np.nan)
-                continue
-
-            entry = row.iloc[0]
-            op_name = entry['operation']
-            size = entry['size']
-            operation_count = get_operation_count(op_name, size)
-            if operation_count <= 0:
-                mean_times.append(np.nan)
-            else:
-                mean_times.append(entry['cpu_time'] / operation_count)
+        combo_times = mean_times[(implementation, build_label)].to_numpy()
 
         offset = (idx - (len(combos) - 1) / 2) * width
         color = IMPLEMENTATION_COLORS.get(implementation)
         alpha = BUILD_ALPHA.get(build_label, 0.85)
         hatch = '//' if build_label == 'portable' else None
 
-        bars = ax.bar(
-            x + offset,
-            mean_times,
+        bars = bar_plot(
+            [position + offset for position in x],
+            combo_times,
             width,
             label=f"{implementation} ({build_label})",
             color=color,
@@ -596,10 +908,10 @@ def create_bar_chart_comparison(df: pd.DataFrame, output_dir: Path):
             edgecolor='black',
         )
 
-        for bar, value in zip(bars, mean_times):
+        for bar, value in zip(bars, combo_times):
             if np.isnan(value) or value <= 0:
                 continue
-            ax.text(
+            text(
                 bar.get_x() + bar.get_width() / 2.0,
                 value,
                 f'{value:.1f}',
@@ -614,14 +926,11 @@ def create_bar_chart_comparison(df: pd.DataFrame, output_dir: Path):
     ax.set_xticks(x)
     ax.set_xticklabels(operations, rotation=45, ha='right')
     ax.legend(fontsize=10)
-    ax.grid(True, alpha=0.3, axis='y')
-
-    plt.tight_layout()
 
     output_path = output_dir / 'bar_comparison.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
+    _save_figure(fig, output_path)
     print(f"Saved bar chart: {output_path}")
-    plt.close()
+    plt.close(fig)
 
 
 def main():
@@ -716,9 +1025,9 @@ def main():
         print("Error: No benchmark data found!")
         sys.exit(1)
 
-    operations_list = sorted(df['operation_label'].unique())
-    implementations_list = sorted(df['implementation'].unique())
-    builds_list = sorted(df['build'].unique())
+    operations_list = list(df['operation_label'].cat.categories)
+    implementations_list = list(df['implementation'].cat.categories)
+    builds_list = list(df['build'].cat.categories)
 
     print(f"\nLoaded {len(df)} benchmark samples from {source_description}.")
     print(f"Operations: {', '.join(operations_list)}")
@@ -727,9 +1036,21 @@ def main():
 
     # Create visualizations
     print("\nGenerating plots...")
-    create_comparison_plots(df, output_dir)
-    create_summary_plot(df, output_dir)
-    create_bar_chart_comparison(df, output_dir)
+    # Every figure is independent and CPU-bound, and matplotlib is not thread-safe,
+    # so one process pool renders the summary, the bar chart, and the per-operation
+    # comparison batches side by side. The summary and bar chart are submitted
+    # first since they are the largest single tasks. Fork-started pools spawn every
+    # worker up front, so the pool is capped at the number of tasks.
+    cpu_count = os.cpu_count() or 1
+    batches = _comparison_batches(df, cpu_count)
+    with ProcessPoolExecutor(max_workers=min(cpu_count, len(batches) + 2)) as executor:
+        plot_futures = [
+            executor.submit(plot_function, df, output_dir)
+            for plot_function in (create_summary_plot, create_bar_chart_comparison)
+        ]
+        _report_comparison_batches(_submit_comparison_batches(executor, batches, output_dir))
+        for future in plot_futures:
+            future.result()
 
     print(f"\nAll plots saved to: {output_dir}")
     print("Done!")